@@ -1,29 +1,99 @@
-from flask import Flask, render_template, request, jsonify, session, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, jsonify, session, redirect, url_for, flash
+from flask.json.provider import JSONProvider
 from flask_sqlalchemy import SQLAlchemy
 from flask_login import LoginManager, login_user, login_required, logout_user, current_user
+from flask_caching import Cache
+from sqlalchemy import event, inspect, literal_column, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime, timedelta
-import threading
+import sqlite3
 import json
+import os
+import threading
 import time
-import random
 from enum import Enum
+from functools import wraps
 import logging
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List
 import numpy as np
+import orjson
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes with orjson straight to UTF-8 bytes.
+
+    datetime values are encoded natively in ISO 8601 form, so views can
+    return them without calling isoformat() first.
+    """
+
+    sort_keys = False
+    compact = True
+
+    @property
+    def option(self):
+        option = 0
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if not self.compact:
+            option |= orjson.OPT_INDENT_2
+        return option
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option),
+                                        mimetype='application/json')
 
 # Initialize Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'hello secret key for predictive maintenance'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///predictive_maintenance.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Pool SQLite connections so the simulator and request threads reuse them and
+# the connect-time PRAGMAs run once per connection; the busy timeout lets the
+# web and simulator processes wait out each other's write locks
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'connect_args': {'check_same_thread': False, 'timeout': 30}
+}
 
 # Initialize extensions
 db = SQLAlchemy(app)
 login_manager = LoginManager()
 login_manager.init_app(app)
 login_manager.login_view = 'login'
+# Shared on disk so cache.clear() after a write reaches every web worker
+cache = Cache(app, config={'CACHE_TYPE': 'FileSystemCache',
+                           'CACHE_DIR': os.path.join(app.instance_path, 'cache')})
+
+SENSOR_STREAM_POLL_INTERVAL = 1  # seconds
+
+# Latest snapshot per system, refreshed by one poller thread per web process
+# and handed to every open sensor stream through the condition
+sensor_snapshots = {}
+sensor_update = threading.Condition()
+sensor_poller = None
+
+@event.listens_for(Engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Use WAL journaling so dashboard reads do not block simulator writes"""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -53,16 +123,6 @@ class AlertLevel(Enum):
     CRITICAL = "critical"
 
 # Data classes
-@dataclass
-class SensorReading:
-    timestamp: datetime
-    system_type: SystemType
-    sensor_type: str
-    value: float
-    unit: str
-    normal_range: tuple
-    is_anomaly: bool = False
-
 @dataclass
 class FaultPrediction:
     timestamp: datetime
@@ -99,13 +159,27 @@ class User(db.Model):
     def is_anonymous(self):
         return False
 
+# Compact codes stored on SensorData rows instead of repeating strings;
+# the unit is implied by the sensor type and not stored at all
+SYSTEM_TYPE_IDS = {
+    SystemType.CONVEYOR: 0,
+    SystemType.BUCKET_ELEVATOR: 1
+}
+SENSOR_TYPE_IDS = {
+    'speed': 0,
+    'vibration': 1,
+    'temperature': 2,
+    'current': 3,
+    'load': 4,
+    'slippage': 5
+}
+
 class SensorData(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    timestamp = db.Column(db.DateTime, default=datetime.utcnow)
-    system_type = db.Column(db.Enum(SystemType), nullable=False)
-    sensor_type = db.Column(db.String(50), nullable=False)
+    timestamp = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    system_type = db.Column(db.SmallInteger, nullable=False, index=True)  # SYSTEM_TYPE_IDS
+    sensor_type = db.Column(db.SmallInteger, nullable=False)  # SENSOR_TYPE_IDS
     value = db.Column(db.Float, nullable=False)
-    unit = db.Column(db.String(20), nullable=False)
     is_anomaly = db.Column(db.Boolean, default=False)
     
 class FaultLog(db.Model):
@@ -121,6 +195,12 @@ class FaultLog(db.Model):
     resolved_at = db.Column(db.DateTime)
     notes = db.Column(db.Text)
 
+    __table_args__ = (
+        db.Index('ix_faultlog_timestamp_desc', timestamp.desc()),
+        # Partial index: open alarms are a small, shrinking slice of the log
+        db.Index('ix_faultlog_open', timestamp, sqlite_where=status == literal_column("'open'")),
+    )
+
 class MaintenanceAction(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     fault_log_id = db.Column(db.Integer, db.ForeignKey('fault_log.id'))
@@ -136,29 +216,16 @@ class MaintenanceAction(db.Model):
 class SystemStatus(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     system_type = db.Column(db.Enum(SystemType), nullable=False)
-    is_running = db.Column(db.Boolean, default=True)
+    is_running = db.Column(db.Boolean, default=False)
     health_score = db.Column(db.Float, default=100.0)
     last_maintenance = db.Column(db.DateTime)
     next_maintenance = db.Column(db.DateTime)
     total_runtime = db.Column(db.Float, default=0.0)  # in hours
     fault_count = db.Column(db.Integer, default=0)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow)
-
-# Global variables for simulation data
-simulation_data = {
-    SystemType.CONVEYOR: {
-        'running': False,
-        'thread': None,
-        'current_readings': {},
-        'fault_injection': None
-    },
-    SystemType.BUCKET_ELEVATOR: {
-        'running': False,
-        'thread': None,
-        'current_readings': {},
-        'fault_injection': None
-    }
-}
+    # Control and output channel for the out-of-process simulator (simulator.py)
+    fault_injection = db.Column(db.Enum(FaultType))
+    latest_readings = db.Column(db.Text)  # JSON snapshot of the last tick
 
 # Fault definitions and maintenance instructions
 FAULT_DEFINITIONS = {
@@ -317,13 +384,19 @@ FAULT_DEFINITIONS = {
     }
 }
 
+# Pre-join the list fields stored as text on every MaintenanceAction
+for fault_info in FAULT_DEFINITIONS.values():
+    fault_info['tools_required_str'] = ', '.join(fault_info['tools_required'])
+    fault_info['safety_precautions_str'] = ', '.join(fault_info['safety_precautions'])
+
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 # Helper functions
 def requires_role(required_role):
     def decorator(f):
+        @wraps(f)
         def decorated_function(*args, **kwargs):
             if not current_user.is_authenticated:
                 return redirect(url_for('login'))
@@ -331,187 +404,59 @@ def requires_role(required_role):
                 flash('Access denied. Insufficient permissions.', 'error')
                 return redirect(url_for('dashboard'))
             return f(*args, **kwargs)
-        decorated_function.__name__ = f.__name__
         return decorated_function
     return decorator
 
-def simulate_sensor_reading(system_type: SystemType, sensor_type: str, 
-                          base_value: float, variance: float, 
-                          fault_injection: Optional[FaultType] = None) -> SensorReading:
-    """Simulate sensor reading with optional fault injection"""
-    
-    # Normal reading
-    value = base_value + random.uniform(-variance, variance)
-    is_anomaly = False
-    
-    # Inject faults to test system behavior
-    if fault_injection:
-        if fault_injection == FaultType.BALL_BEARING and sensor_type == 'vibration':
-            value *= random.uniform(2.0, 4.0)  # Significant vibration increase
-            is_anomaly = True
-        elif fault_injection == FaultType.BELT_SLIPPAGE and sensor_type == 'speed':
-            value *= random.uniform(0.6, 0.8)  # Speed reduction
-            is_anomaly = True
-        elif fault_injection == FaultType.DRIVE_MOTOR and sensor_type == 'current':
-            value *= random.uniform(1.5, 2.5)  # Current increase
-            is_anomaly = True
-        elif fault_injection == FaultType.CENTRAL_SHAFT and sensor_type == 'vibration':
-            value *= random.uniform(1.8, 3.0)  # Vibration increase
-            is_anomaly = True
-        elif fault_injection == FaultType.IDLER_ROLLER and sensor_type == 'temperature':
-            value *= random.uniform(1.3, 1.8)  # Temperature increase
-            is_anomaly = True
-        elif fault_injection == FaultType.PULLEY and sensor_type in ['speed', 'vibration']:
-            value *= random.uniform(1.2, 2.0)  # Multiple symptoms
-            is_anomaly = True
-    
-    # Define normal ranges for different sensors
-    normal_ranges = {
-        'speed': (0.5, 3.0),
-        'vibration': (0, 15),
-        'temperature': (20, 70),
-        'current': (5, 45),
-        'load': (0, 100),
-        'slippage': (0, 8)
-    }
-    
-    normal_range = normal_ranges.get(sensor_type, (0, 100))
-    
-    return SensorReading(
-        timestamp=datetime.utcnow(),
-        system_type=system_type,
-        sensor_type=sensor_type,
-        value=value,
-        unit=get_sensor_unit(sensor_type),
-        normal_range=normal_range,
-        is_anomaly=is_anomaly
-    )
+def query_open_alarms() -> List[FaultLog]:
+    """Fetch open alarms; the status is inlined so SQLite can use the partial index"""
+    return FaultLog.query.filter(FaultLog.status == literal_column("'open'")).all()
 
-def get_sensor_unit(sensor_type: str) -> str:
-    """Get unit for sensor type"""
-    units = {
-        'speed': 'm/s',
-        'vibration': 'm/s²',
-        'temperature': '°C',
-        'current': 'A',
-        'load': '%',
-        'slippage': '%'
-    }
-    return units.get(sensor_type, '')
-
-def store_sensor_reading(reading: SensorReading):
-    """Store sensor reading in database"""
-    sensor_data = SensorData(
-        timestamp=reading.timestamp,
-        system_type=reading.system_type,
-        sensor_type=reading.sensor_type,
-        value=reading.value,
-        unit=reading.unit,
-        is_anomaly=reading.is_anomaly
-    )
-    db.session.add(sensor_data)
-    db.session.commit()
+def load_sensor_snapshot(system_type: SystemType) -> str:
+    """Return the simulator's latest serialized readings for a system"""
+    row = db.session.query(SystemStatus.latest_readings).filter_by(system_type=system_type).first()
+    return (row and row.latest_readings) or '{}'
 
-def simulate_system_data(system_type: SystemType):
-    """Simulate continuous sensor data for a system"""
-    logger.info(f"Starting simulation for {system_type.value}")
-
-    system_status = SystemStatus.query.filter_by(system_type=system_type).first()
-    if not system_status:
-        system_status = SystemStatus(system_type=system_type)
-        db.session.add(system_status)
-    
-    system_status.is_running = True
-    db.session.commit()
-    
-    sensor_configs = {
-        'speed': {'base': 1.5, 'variance': 0.1},
-        'vibration': {'base': 5.0, 'variance': 1.0},
-        'temperature': {'base': 45.0, 'variance': 5.0},
-        'current': {'base': 15.0, 'variance': 2.0},
-        'load': {'base': 60.0, 'variance': 10.0},
-        'slippage': {'base': 2.0, 'variance': 0.5}
-    }
-    
-    while simulation_data[system_type]['running']:
-        try:
-            current_readings = {}
-            fault_injection = simulation_data[system_type]['fault_injection']
-            
-            # Generate readings for all sensors
-            for sensor_type, config in sensor_configs.items():
-                reading = simulate_sensor_reading(
-                    system_type=system_type,
-                    sensor_type=sensor_type,
-                    base_value=config['base'],
-                    variance=config['variance'],
-                    fault_injection=fault_injection
-                )
-                
-                current_readings[sensor_type] = reading
-                store_sensor_reading(reading)
-            
-            # Update global simulation data
-            simulation_data[system_type]['current_readings'] = current_readings
-            
-            # Check for fault conditions and create predictions
-            if fault_injection:
-                create_fault_prediction(system_type, fault_injection, current_readings)
-            
-            time.sleep(2)  # Update every 2 seconds
+def poll_sensor_snapshots():
+    """Read every system's latest readings once per tick and wake the streams"""
+    with app.app_context():
+        while True:
+            try:
+                rows = db.session.query(SystemStatus.system_type, SystemStatus.latest_readings).all()
+                db.session.close()
+                with sensor_update:
+                    changed = False
+                    for system_type, snapshot in rows:
+                        snapshot = snapshot or '{}'
+                        if sensor_snapshots.get(system_type) != snapshot:
+                            sensor_snapshots[system_type] = snapshot
+                            changed = True
+                    if changed:
+                        sensor_update.notify_all()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error polling sensor snapshots: {str(e)}")
             
-        except Exception as e:
-            logger.error(f"Error in simulation for {system_type.value}: {e}")
-            time.sleep(5)
-
-def create_fault_prediction(system_type: SystemType, fault_type: FaultType, readings: Dict):
-    """Create fault prediction based on sensor readings"""
-    
-    # Calculate confidence based on anomaly detection
-    anomaly_count = sum(1 for reading in readings.values() if reading.is_anomaly)
-    confidence = min(0.95, 0.6 + (anomaly_count / len(readings)) * 0.35)
-    
-    # Determine severity
-    if confidence > 0.9:
-        severity = "CRITICAL"
-    elif confidence > 0.7:
-        severity = "HIGH"
-    elif confidence > 0.5:
-        severity = "MEDIUM"
-    else:
-        severity = "LOW"
-    
-    # Get fault information
-    fault_info = FAULT_DEFINITIONS[fault_type]
-    
-    # Create fault log entry
-    fault_log = FaultLog(
-        timestamp=datetime.utcnow(),
-        system_type=system_type,
-        fault_type=fault_type,
-        confidence=confidence,
-        severity=severity
-    )
-    
-    db.session.add(fault_log)
-    db.session.commit()
-    
-    # Create maintenance actions
-    for i, action in enumerate(fault_info['maintenance_steps']):
-        maintenance_action = MaintenanceAction(
-            fault_log_id=fault_log.id,
-            action_description=action,
-            priority=severity,
-            estimated_duration=30 + i * 15,  # Estimated duration
-            required_tools=', '.join(fault_info['tools_required']),
-            safety_precautions=', '.join(fault_info['safety_precautions'])
-        )
-        db.session.add(maintenance_action)
-    
-    db.session.commit()
-    
-    logger.info(f"Created fault prediction: {fault_type.name} for {system_type.value} with confidence {confidence:.2f}")
-
+            time.sleep(SENSOR_STREAM_POLL_INTERVAL)
+
+def start_sensor_poller():
+    """Start this process's snapshot poller on the first stream request"""
+    global sensor_poller
+    with sensor_update:
+        if sensor_poller is None:
+            sensor_poller = threading.Thread(target=poll_sensor_snapshots)
+            sensor_poller.daemon = True
+            sensor_poller.start()
+
+def serialize_system_status(status: SystemStatus) -> Dict:
+    """Build the JSON payload for a single system status row"""
+    return {
+        'is_running': status.is_running,
+        'health_score': status.health_score,
+        'last_maintenance': status.last_maintenance,
+        'next_maintenance': status.next_maintenance,
+        'total_runtime': status.total_runtime,
+        'fault_count': status.fault_count
+    }
 
 @app.route('/api/stop-simulation/<system_type>')
 @login_required
@@ -520,13 +465,13 @@ def stop_simulation(system_type):
     """API endpoint to stop system simulation"""
     try:
         system_enum = SystemType(system_type.lower())
-        simulation_data[system_enum]['running'] = False
         
-        # Update system status
+        # The simulator worker stops generating readings once it sees the flag
         system_status = SystemStatus.query.filter_by(system_type=system_enum).first()
         if system_status:
             system_status.is_running = False
             db.session.commit()
+            cache.clear()
         
         return jsonify({'status': 'stopped', 'message': f'{system_type} simulation stopped'})
         
@@ -572,7 +517,7 @@ def dashboard():
     recent_faults = FaultLog.query.order_by(FaultLog.timestamp.desc()).limit(10).all()
     
     # Get active alarms
-    active_alarms = FaultLog.query.filter_by(status='open').all()
+    active_alarms = query_open_alarms()
     
     # Pass user information to the template
     return render_template('dashboard.html', 
@@ -584,25 +529,45 @@ def dashboard():
 
 @app.route('/api/sensor-data/<system_type>')
 @login_required
+@cache.cached(timeout=1)
 def get_sensor_data(system_type):
     """API endpoint to get current sensor data"""
     try:
         system_enum = SystemType(system_type.lower())
-        readings = simulation_data[system_enum]['current_readings']
-        
-        data = {}
-        for sensor_type, reading in readings.items():
-            data[sensor_type] = {
-                'value': reading.value,
-                'unit': reading.unit,
-                'timestamp': reading.timestamp.isoformat(),
-                'is_anomaly': reading.is_anomaly
-            }
         
-        return jsonify(data)
+        # Readings are already serialized by the simulator worker
+        return Response(load_sensor_snapshot(system_enum), mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/sensor-stream/<system_type>')
+@login_required
+def stream_sensor_data(system_type):
+    """Server-Sent Events stream of sensor snapshots, one event per simulator tick"""
+    try:
+        system_enum = SystemType(system_type.lower())
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    start_sensor_poller()
+    
+    def generate():
+        last_snapshot = None
+        while True:
+            with sensor_update:
+                sensor_update.wait_for(lambda: sensor_snapshots.get(system_enum) is not last_snapshot, timeout=15)
+                snapshot = sensor_snapshots.get(system_enum)
+            
+            if snapshot is last_snapshot:
+                # Comment line keeps idle connections from being dropped by proxies
+                yield ': keep-alive\n\n'
+            else:
+                last_snapshot = snapshot
+                yield f'data: {snapshot}\n\n'
+    
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/start-simulation/<system_type>')
 @login_required
 @requires_role(UserRole.ENGINEER)
@@ -610,13 +575,16 @@ def start_simulation(system_type):
     """API endpoint to start system simulation"""
     try:
         system_enum = SystemType(system_type.lower())
+        system_status = SystemStatus.query.filter_by(system_type=system_enum).first()
+        if not system_status:
+            system_status = SystemStatus(system_type=system_enum, is_running=False)
+            db.session.add(system_status)
         
-        if not simulation_data[system_enum]['running']:
-            simulation_data[system_enum]['running'] = True
-            thread = threading.Thread(target=simulate_system_data, args=(system_enum,))
-            thread.daemon = True
-            thread.start()
-            simulation_data[system_enum]['thread'] = thread
+        if not system_status.is_running:
+            # The simulator worker picks the flag up on its next poll
+            system_status.is_running = True
+            db.session.commit()
+            cache.clear()
             
             return jsonify({'status': 'started', 'message': f'{system_type} simulation started'})
         else:
@@ -635,7 +603,13 @@ def inject_fault(system_type, fault_type):
         system_enum = SystemType(system_type.lower())
         fault_enum = FaultType(int(fault_type))
         
-        simulation_data[system_enum]['fault_injection'] = fault_enum
+        system_status = SystemStatus.query.filter_by(system_type=system_enum).first()
+        if not system_status:
+            system_status = SystemStatus(system_type=system_enum, is_running=False)
+            db.session.add(system_status)
+        
+        system_status.fault_injection = fault_enum
+        db.session.commit()
         
         return jsonify({
             'status': 'fault_injected',
@@ -652,7 +626,14 @@ def clear_fault(system_type):
     """API endpoint to clear fault injection"""
     try:
         system_enum = SystemType(system_type.lower())
-        simulation_data[system_enum]['fault_injection'] = None
+        
+        system_status = SystemStatus.query.filter_by(system_type=system_enum).first()
+        if not system_status:
+            system_status = SystemStatus(system_type=system_enum, is_running=False)
+            db.session.add(system_status)
+        
+        system_status.fault_injection = None
+        db.session.commit()
         
         return jsonify({
             'status': 'fault_cleared',
@@ -666,6 +647,7 @@ def clear_fault(system_type):
 
 @app.route('/api/system-status')
 @login_required
+@cache.cached(timeout=2)
 def get_system_status():
     """API endpoint to get system status for both systems"""
     conveyor_status = SystemStatus.query.filter_by(system_type=SystemType.CONVEYOR).first()
@@ -682,65 +664,49 @@ def get_system_status():
         db.session.commit()
     
     return jsonify({
-        'CONVEYOR': {
-            'is_running': conveyor_status.is_running,
-            'health_score': conveyor_status.health_score,
-            'last_maintenance': conveyor_status.last_maintenance.isoformat() if conveyor_status.last_maintenance else None,
-            'next_maintenance': conveyor_status.next_maintenance.isoformat() if conveyor_status.next_maintenance else None,
-            'total_runtime': conveyor_status.total_runtime,
-            'fault_count': conveyor_status.fault_count
-        },
-        'BUCKET_ELEVATOR': {
-            'is_running': elevator_status.is_running,
-            'health_score': elevator_status.health_score,
-            'last_maintenance': elevator_status.last_maintenance.isoformat() if elevator_status.last_maintenance else None,
-            'next_maintenance': elevator_status.next_maintenance.isoformat() if elevator_status.next_maintenance else None,
-            'total_runtime': elevator_status.total_runtime,
-            'fault_count': elevator_status.fault_count
-        }
+        'CONVEYOR': serialize_system_status(conveyor_status),
+        'BUCKET_ELEVATOR': serialize_system_status(elevator_status)
     })
 
 @app.route('/api/recent-faults')
 @login_required
+@cache.cached(timeout=2)
 def get_recent_faults():
     """API endpoint to get recent faults"""
     recent_faults = FaultLog.query.order_by(FaultLog.timestamp.desc()).limit(10).all()
     
-    faults_data = []
-    for fault in recent_faults:
-        faults_data.append({
-            'id': fault.id,
-            'timestamp': fault.timestamp.isoformat(),
-            'system_type': fault.system_type.value,
-            'fault_type': fault.fault_type.value,
-            'confidence': fault.confidence,
-            'severity': fault.severity,
-            'status': fault.status,
-            'acknowledged_by': fault.acknowledged_by,
-            'resolved_by': fault.resolved_by,
-            'resolved_at': fault.resolved_at.isoformat() if fault.resolved_at else None,
-            'notes': fault.notes
-        })
+    faults_data = [{
+        'id': fault.id,
+        'timestamp': fault.timestamp,
+        'system_type': fault.system_type.value,
+        'fault_type': fault.fault_type.value,
+        'confidence': fault.confidence,
+        'severity': fault.severity,
+        'status': fault.status,
+        'acknowledged_by': fault.acknowledged_by,
+        'resolved_by': fault.resolved_by,
+        'resolved_at': fault.resolved_at,
+        'notes': fault.notes
+    } for fault in recent_faults]
     
     return jsonify(faults_data)
 
 @app.route('/api/active-alarms')
 @login_required
+@cache.cached(timeout=2)
 def get_active_alarms():
     """API endpoint to get active alarms"""
-    active_alarms = FaultLog.query.filter_by(status='open').all()
-    
-    alarms_data = []
-    for alarm in active_alarms:
-        alarms_data.append({
-            'id': alarm.id,
-            'timestamp': alarm.timestamp.isoformat(),
-            'system_type': alarm.system_type.value,
-            'fault_type': alarm.fault_type.value,
-            'confidence': alarm.confidence,
-            'severity': alarm.severity,
-            'status': alarm.status
-        })
+    active_alarms = query_open_alarms()
+    
+    alarms_data = [{
+        'id': alarm.id,
+        'timestamp': alarm.timestamp,
+        'system_type': alarm.system_type.value,
+        'fault_type': alarm.fault_type.value,
+        'confidence': alarm.confidence,
+        'severity': alarm.severity,
+        'status': alarm.status
+    } for alarm in active_alarms]
     
     return jsonify(alarms_data)
 
@@ -749,20 +715,81 @@ def get_active_alarms():
 @requires_role(UserRole.ENGINEER)
 def acknowledge_alarm(alarm_id):
     """API endpoint to acknowledge an alarm"""
-    alarm = FaultLog.query.get(alarm_id)
-    if not alarm:
+    # Single UPDATE; rowcount doubles as the existence check
+    result = db.session.execute(
+        update(FaultLog)
+        .where(FaultLog.id == alarm_id)
+        .values(status='acknowledged', acknowledged_by=current_user.id)
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
         return jsonify({'error': 'Alarm not found'}), 404
     
-    alarm.status = 'acknowledged'
-    alarm.acknowledged_by = current_user.id
     db.session.commit()
+    cache.clear()
     
     return jsonify({'status': 'acknowledged', 'message': f'Alarm {alarm_id} acknowledged'})
 
-if __name__ == '__main__':
+def add_missing_columns(table):
+    """Add nullable columns defined on the model but absent from the database table,
+    returning the names of the columns added"""
+    existing = {column['name'] for column in inspect(db.engine).get_columns(table.name)}
+    added = []
+    for column in table.columns:
+        if column.name not in existing:
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            db.session.execute(text(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}'))
+            added.append(column.name)
+    db.session.commit()
+    return added
+
+def migrate_sensor_data():
+    """Rebuild sensor_data with integer codes if it still uses the string schema"""
+    columns = {column['name'] for column in inspect(db.engine).get_columns('sensor_data')}
+    if 'unit' not in columns:
+        return
+    
+    def case(column, ids):
+        whens = ' '.join(f"WHEN '{key}' THEN {code}" for key, code in ids.items())
+        return f'CASE {column} {whens} END'
+    
+    system_ids = {system.name: code for system, code in SYSTEM_TYPE_IDS.items()}
+    with db.engine.begin() as connection:
+        # Indexes follow a renamed table, so drop them to free their names
+        for index in SensorData.__table__.indexes:
+            connection.execute(text(f'DROP INDEX IF EXISTS {index.name}'))
+        connection.execute(text('ALTER TABLE sensor_data RENAME TO sensor_data_old'))
+        SensorData.__table__.create(connection)
+        connection.execute(text(
+            'INSERT INTO sensor_data (id, timestamp, system_type, sensor_type, value, is_anomaly) '
+            f"SELECT id, timestamp, {case('system_type', system_ids)}, "
+            f"{case('sensor_type', SENSOR_TYPE_IDS)}, value, is_anomaly "
+            'FROM sensor_data_old WHERE sensor_type IN ({})'.format(
+                ', '.join(f"'{sensor_type}'" for sensor_type in SENSOR_TYPE_IDS))
+        ))
+        connection.execute(text('DROP TABLE sensor_data_old'))
+    logger.info("Migrated sensor_data to integer-coded columns")
+
+def init_db():
+    """Create tables, indexes and default records if they do not exist yet"""
     with app.app_context():
         db.create_all()
         
+        # create_all() skips tables that already exist, so add any columns and
+        # indexes introduced after an existing database was created
+        if add_missing_columns(SystemStatus.__table__):
+            # is_running now starts the simulator worker; flags left over from
+            # the in-process simulator are stale, so clear them once
+            db.session.execute(update(SystemStatus).values(is_running=False))
+            db.session.commit()
+        migrate_sensor_data()
+        for table in (SensorData.__table__, FaultLog.__table__):
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
+        # Superseded by the partial ix_faultlog_open index
+        db.session.execute(text('DROP INDEX IF EXISTS ix_faultlog_status'))
+        db.session.commit()
+        
         # Create default admin user if doesn't exist
         if not User.query.filter_by(username='admin').first():
             admin = User(username='admin', email='admin@example.com', role=UserRole.ADMIN)
@@ -777,5 +804,15 @@ if __name__ == '__main__':
             
             db.session.commit()
             logger.info("Default admin user and system status entries created")
-    
-        app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+
+@app.cli.command('init-db')
+def init_db_command():
+    """Create or migrate the database; run once before starting workers"""
+    init_db()
+    logger.info("Database initialized")
+
+if __name__ == '__main__':
+    # Development server only; production runs through wsgi.py.
+    # Sensor data comes from the separate simulator worker (python simulator.py)
+    init_db()
+    app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,11 +1,65 @@
 import vpython as vp
 import math
-import random
+import sys
 import time
 import threading
+from collections import deque
 import numpy as np
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels below then run as plain Python
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Sandy material colours; the material is drawn as one points object per shade
+SAND_SHADES = (
+    vp.vector(0.95, 0.78, 0.28),
+    vp.vector(0.88, 0.72, 0.22),
+    vp.vector(0.80, 0.66, 0.16),
+    vp.vector(0.74, 0.62, 0.12)
+)
+
+# HMI colour and console icon for each status band: normal, warning, alarm
+STATUS_COLORS = (vp.color.green, vp.color.yellow, vp.color.red)
+STATUS_ICONS = ('🟢', '🟡', '🔴')
+
+# Sensor layout: SensorSystem keeps one array slot per sensor, in this order
+SENSOR_NAMES = ('speed', 'load', 'temperature', 'vibration', 'current', 'slippage')
+SPEED, LOAD, TEMPERATURE, VIBRATION, CURRENT, SLIPPAGE = range(len(SENSOR_NAMES))
+SENSOR_LABELS = tuple(name.replace('_', ' ').title() for name in SENSOR_NAMES)
+SENSOR_UNITS = ('m/s', '%', '°C', 'm/s²', 'A', '%')
+SENSOR_MINS = (0, 0, 20, 0, 0, 0)
+SENSOR_MAXS = (4, 100, 80, 20, 50, 10)
+ALARM_THRESHOLDS = (3.2, 85, 70, 15, 45, 8)
+SENSOR_NOISE = (0.05, 0, 1, 0.5, 1, 0.2)  # Amplitude of uniform measurement noise
+
+STATUS_SEPARATOR = "=" * 80
+SENSOR_STATUS_LINE = "  %s %s: %.2f %s"  # icon, label, value, unit
+
+# Console alarm line per sensor, leaving only the reading to format
+ALARM_MESSAGES = tuple(
+    f"🚨 ALARM: {name} = {{:.2f}} {unit} (Threshold: {threshold} {unit})"
+    for name, unit, threshold in zip(SENSOR_NAMES, SENSOR_UNITS, ALARM_THRESHOLDS)
+)
+
+@njit(cache=True, fastmath=True)
+def _advance_material(pos_x, pos_z, alive, noise, half_len, dx):
+    """Move every live particle that is on the belt; returns how many moved"""
+    moved = 0
+    for i in range(pos_x.shape[0]):
+        if alive[i] and -half_len < pos_x[i] < half_len:
+            pos_x[i] += dx
+            pos_z[i] += noise[i]
+            moved += 1
+    return moved
+
+# Compile up front rather than on the first animation frame
+_advance_material(np.zeros(1), np.zeros(1), np.zeros(1, dtype=bool), np.zeros(1), 1.0, 0.0)
+
 class ConveyorBeltSystem:
     def __init__(self):
         # Create the scene
@@ -16,6 +70,7 @@ class ConveyorBeltSystem:
         
         # Conveyor parameters
         self.length = 20
+        self._half_len = self.length * 0.5
         self.width = 3
         self.height = 1.5
         self.belt_speed = 1.5  # m/s
@@ -23,14 +78,18 @@ class ConveyorBeltSystem:
         self.min_speed = 0.5
         
         # Material parameters
-        self.material_particles = []
         self.material_count = 0
         self.max_material = 200
         self.loading_rate = 0.3  # particles per second
+        self._load_accum = 0.0  # Fractional particles loaded but not yet placed
         
         # Operational data
         self.operating_time = 0
-        self.last_update_time = time.time()
+        self.last_update_time = time.monotonic()
+        
+        # Random source for material loading and movement; the sensor system on
+        # the monitoring thread owns a separate generator
+        self.rng = np.random.default_rng()
         
         # Initialize systems
         self.sensor_system = SensorSystem()
@@ -46,6 +105,19 @@ class ConveyorBeltSystem:
         
         # Animation parameters
         self.dt = 0.02
+        self.set_belt_speed(self.belt_speed)
+        
+        # Pulley rotation is accumulated and applied once it is large enough
+        # to see, so near-zero belt speeds do not cost a scene update per frame
+        self._pending_rotation = 0.0
+        self._min_rotation = 1e-3  # radians
+        self._pulley_axis = vp.vector(0, 0, 1)
+        
+        # The animation loop wakes the monitoring thread every 25 frames
+        # (twice per second at 50 fps) so sensor updates follow the frame clock
+        self.monitor_interval_frames = 25
+        self._frame = 0
+        self._tick_event = threading.Event()
         
         # Start monitoring thread
         self.start_monitoring()
@@ -147,45 +219,60 @@ class ConveyorBeltSystem:
 
     def create_material_flow(self):
         """Create material particles representing crushed sand"""
-        self.material_particles = []
+        # Particle state lives in parallel arrays indexed by slot. Rendering
+        # uses one points object per sand shade, so each frame pushes a whole
+        # position buffer per shade instead of updating particles one by one
+        self.material_points = [
+            vp.points(radius=0.15, size_units='world', color=shade)
+            for shade in SAND_SHADES
+        ]
+        self.pos_x = np.zeros(self.max_material)
+        self.pos_y = np.zeros(self.max_material)
+        self.pos_z = np.zeros(self.max_material)
+        self.shade = np.zeros(self.max_material, dtype=np.uint8)
+        self.alive = np.zeros(self.max_material, dtype=bool)
+        self._free_slots = list(range(self.max_material - 1, -1, -1))
+        self._material_dirty = False
         
         # Initial material in hopper
         for _ in range(20):
             self.add_material_particle(hopper=True)
+        self.redraw_material()
 
     def add_material_particle(self, hopper=False):
         """Add a new material particle"""
+        if not self._free_slots:
+            return
+        slot = self._free_slots.pop()
+        
         if hopper:
             # Position in hopper
-            pos = vp.vector(
-                -self.length/2 + random.uniform(-1, 1),
-                2 + random.uniform(0, 2),
-                random.uniform(-1, 1)
-            )
+            dx, dy, z = self.rng.uniform((-1, 0, -1), (1, 2, 1)).tolist()
+            x = -self._half_len + dx
+            y = 2 + dy
         else:
             # Position at loading point
-            pos = vp.vector(
-                -self.length/2 + 0.5,
-                1.2,
-                random.uniform(-self.width/2 + 0.3, self.width/2 - 0.3)
-            )
+            x = -self._half_len + 0.5
+            y = 1.2
+            z = float(self.rng.uniform(-self.width/2 + 0.3, self.width/2 - 0.3))
             
-        particle = vp.sphere(
-            pos=pos,
-            radius=0.15,
-            color=vp.vector(random.uniform(0.7, 1.0), 
-                          random.uniform(0.6, 0.8), 
-                          random.uniform(0.1, 0.3)),  # Sandy color
-            make_trail=False
-        )
-        
-        if hopper:
-            particle.velocity = vp.vector(0, 0, 0)
-        else:
-            particle.velocity = vp.vector(self.belt_speed, 0, 0)
-            
-        self.material_particles.append(particle)
+        self.pos_x[slot] = x
+        self.pos_y[slot] = y
+        self.pos_z[slot] = z
+        self.shade[slot] = self.rng.integers(len(SAND_SHADES))  # Sandy color
+        self.alive[slot] = True
         self.material_count += 1
+        self._material_dirty = True
+
+    def redraw_material(self):
+        """Push current particle positions to the points object for each shade"""
+        for shade, points in enumerate(self.material_points):
+            slots = np.flatnonzero(self.alive & (self.shade == shade))
+            points.clear()
+            if slots.size:
+                points.append([vp.vector(x, y, z) for x, y, z in zip(
+                    self.pos_x[slots].tolist(), self.pos_y[slots].tolist(), self.pos_z[slots].tolist())])
+        self._material_dirty = False
 
     def create_sensor_visuals(self):
         """Create visual indicators for sensors"""
@@ -276,20 +363,30 @@ class ConveyorBeltSystem:
             pos=self.scene.title_anchor,
             color=vp.color.red
         )
+        
+        # Last text and status band written to each display, so unchanged
+        # readings are not pushed to the scene again
+        self._last_hmi = {name: ("0.00", 0) for name in self.sensor_displays}
+        self._last_health = ("System Health: 100%", 0)
+        self._last_alarm_text = "<b>ALARMS:</b> None"
 
     def start_monitoring(self):
         """Start the monitoring system in a separate thread"""
         def monitoring_loop():
             while True:
                 # Calculate material on belt
-                belt_material = sum(1 for p in self.material_particles 
-                                  if -self.length/2 < p.pos.x < self.length/2)
+                belt_material = int(np.count_nonzero(
+                    self.alive & (self.pos_x > -self._half_len) & (self.pos_x < self._half_len)))
+                
+                # One clock read per tick, shared by the readings and the status cadence
+                current_time = time.monotonic()
                 
                 # Update sensors
                 self.sensor_system.update_sensors(
                     belt_speed=self.belt_speed,
                     material_count=belt_material,
-                    operating_time=self.operating_time
+                    operating_time=self.operating_time,
+                    timestamp=current_time
                 )
                 
                 # Run predictive maintenance analysis
@@ -302,12 +399,13 @@ class ConveyorBeltSystem:
                 self.update_hmi_displays()
                 
                 # Print status every 5 seconds
-                current_time = time.time()
                 if current_time - self.last_update_time > 5:
                     self.print_status()
                     self.last_update_time = current_time
                 
-                time.sleep(0.5)  # Update twice per second
+                # Wait for the animation loop's next monitoring tick
+                self._tick_event.wait()
+                self._tick_event.clear()
         
         monitoring_thread = threading.Thread(target=monitoring_loop, daemon=True)
         monitoring_thread.start()
@@ -315,33 +413,35 @@ class ConveyorBeltSystem:
     def update_hmi_displays(self):
         """Update HMI display based on sensor values"""
         # Update sensor value displays
-        for sensor_name, display in self.sensor_displays.items():
-            value = self.sensor_system.sensors[sensor_name]['value']
-            unit = self.sensor_system.sensors[sensor_name]['unit']
-            
-            # Color coding based on thresholds
-            threshold = self.sensor_system.sensors[sensor_name]['alarm_threshold']
-            if value > threshold:
-                color = vp.color.red
-            elif value > threshold * 0.8:
-                color = vp.color.yellow
-            else:
-                color = vp.color.green
-                
-            display.text = f"{value:.2f}"
-            display.color = color
+        # Color coding based on thresholds, classified for all sensors at once
+        values = self.sensor_system.values.tolist()
+        bands = self.sensor_system.status_bands().tolist()
+        for sensor_name, value, band in zip(SENSOR_NAMES, values, bands):
+            display = self.sensor_displays[sensor_name]
+            text = f"{value:.2f}"
+            last_text, last_band = self._last_hmi[sensor_name]
+            if text != last_text:
+                display.text = text
+            if band != last_band:
+                display.color = STATUS_COLORS[band]
+            self._last_hmi[sensor_name] = (text, band)
         
         # Update maintenance display
         health = self.predictive_maintenance.maintenance_score
         if health > 80:
-            color = vp.color.green
+            band = 0
         elif health > 60:
-            color = vp.color.yellow
+            band = 1
         else:
-            color = vp.color.red
-            
-        self.maintenance_display.text = f"System Health: {health:.1f}%"
-        self.maintenance_display.color = color
+            band = 2
+        
+        text = f"System Health: {health:.1f}%"
+        last_text, last_band = self._last_health
+        if text != last_text:
+            self.maintenance_display.text = text
+        if band != last_band:
+            self.maintenance_display.color = STATUS_COLORS[band]
+        self._last_health = (text, band)
         
         # Update alarms
         if self.sensor_system.alarms:
@@ -349,65 +449,93 @@ class ConveyorBeltSystem:
             alarm_text = (f"<b>ALARM:</b> {latest_alarm['sensor']} = "
                          f"{latest_alarm['value']:.2f} {latest_alarm['unit']} "
                          f"(Threshold: {latest_alarm['threshold']})")
-            self.alarm_display.text = alarm_text
         else:
-            self.alarm_display.text = "<b>ALARMS:</b> None"
+            alarm_text = "<b>ALARMS:</b> None"
+        if alarm_text != self._last_alarm_text:
+            self.alarm_display.text = alarm_text
+            self._last_alarm_text = alarm_text
 
     def print_status(self):
         """Print current system status"""
-        print("\n" + "="*80)
-        print(f"📊 CONVEYOR BELT STATUS - Runtime: {self.operating_time:.0f}s")
-        print("="*80)
+        # Assemble the whole block and write it in one call so it is not
+        # interleaved with output from the animation thread
+        lines = [
+            "\n" + STATUS_SEPARATOR,
+            f"📊 CONVEYOR BELT STATUS - Runtime: {self.operating_time:.0f}s",
+            STATUS_SEPARATOR
+        ]
         
         # Sensor readings
-        print("🔍 SENSOR READINGS:")
-        for sensor_name, sensor_data in self.sensor_system.sensors.items():
-            status = "🔴" if sensor_data['value'] > sensor_data['alarm_threshold'] else "🟢"
-            print(f"  {status} {sensor_name.title()}: {sensor_data['value']:.2f} {sensor_data['unit']}")
+        lines.append("🔍 SENSOR READINGS:")
+        lines.extend(
+            SENSOR_STATUS_LINE % (STATUS_ICONS[band], label, value, unit)
+            for label, value, unit, band in zip(
+                SENSOR_LABELS, self.sensor_system.values.tolist(), SENSOR_UNITS,
+                self.sensor_system.status_bands().tolist())
+        )
         
         # Control system status
-        print(f"\n🎛️ CONTROL SYSTEM:")
-        print(f"  Auto Mode: {'ON' if self.control_system.auto_mode else 'OFF'}")
-        print(f"  Current Speed: {self.belt_speed:.2f} m/s")
-        print(f"  Emergency Stop: {'ACTIVE' if self.control_system.emergency_stop else 'NORMAL'}")
+        lines.extend([
+            "\n🎛️ CONTROL SYSTEM:",
+            f"  Auto Mode: {'ON' if self.control_system.auto_mode else 'OFF'}",
+            f"  Current Speed: {self.belt_speed:.2f} m/s",
+            f"  Emergency Stop: {'ACTIVE' if self.control_system.emergency_stop else 'NORMAL'}"
+        ])
         
         # Predictive maintenance
-        print(f"\n🔧 PREDICTIVE MAINTENANCE:")
-        print(f"  Equipment Health: {self.predictive_maintenance.maintenance_score:.1f}%")
+        lines.extend([
+            "\n🔧 PREDICTIVE MAINTENANCE:",
+            f"  Equipment Health: {self.predictive_maintenance.maintenance_score:.1f}%"
+        ])
         if self.predictive_maintenance.maintenance_recommendations:
-            print("  Recommendations:")
-            for rec in self.predictive_maintenance.maintenance_recommendations:
-                print(f"    - {rec}")
+            lines.append("  Recommendations:")
+            lines.extend(f"    - {rec}" for rec in self.predictive_maintenance.maintenance_recommendations)
         
         # Recent alarms
-        if self.sensor_system.alarms:
-            recent_alarms = self.sensor_system.alarms[-3:]  # Last 3 alarms
-            print(f"\n🚨 RECENT ALARMS:")
-            for alarm in recent_alarms:
-                print(f"  {alarm['timestamp'].strftime('%H:%M:%S')} - {alarm['sensor']}: "
-                      f"{alarm['value']:.2f} (Severity: {alarm['severity']})")
+        recent_alarms = self.sensor_system.recent_alarms  # Last 3 alarms
+        if recent_alarms:
+            lines.append("\n🚨 RECENT ALARMS:")
+            lines.extend(f"  {alarm['clock']} - {alarm['sensor']}: "
+                         f"{alarm['value']:.2f} (Severity: {alarm['severity']})"
+                         for alarm in recent_alarms)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def update_material_flow(self):
         """Update material particle physics"""
-        # Add new material if not at max capacity
-        if (self.material_count < self.max_material and 
-            random.random() < self.loading_rate * self.dt and
-            not self.control_system.emergency_stop):
-            self.add_material_particle()
-        
-        # Update existing material
-        for particle in self.material_particles:
-            # Only move material that's on the belt
-            if -self.length/2 < particle.pos.x < self.length/2:
-                particle.pos.x += self.belt_speed * self.dt
-                
-                # Add some random movement
-                particle.pos.z += random.uniform(-0.01, 0.01)
-                
-                # Remove material that reached the end
-                if particle.pos.x > self.length/2:
-                    particle.visible = False
-                    self.material_count -= 1
+        # Add new material at the loading rate if not at max capacity
+        if not self.control_system.emergency_stop and self.material_count < self.max_material:
+            self._load_accum += self.loading_rate * self.dt
+            while self._load_accum >= 1.0 and self.material_count < self.max_material:
+                self.add_material_particle()
+                self._load_accum -= 1.0
+        
+        # Move material that's on the belt, with some random sideways movement
+        noise = self.rng.uniform(-0.01, 0.01, self.max_material)
+        moved = _advance_material(self.pos_x, self.pos_z, self.alive, noise,
+                                  self._half_len, self._belt_dx)
+        if not moved:
+            if self._material_dirty:
+                self.redraw_material()
+            return
+        
+        # Remove material that reached the end and hand its slot back
+        for slot in np.flatnonzero(self.alive & (self.pos_x > self._half_len)).tolist():
+            self.alive[slot] = False
+            self._free_slots.append(slot)
+            self.material_count -= 1
+        
+        # Every slot is either live or on the free stack; a mismatch means a leak
+        assert len(self._free_slots) + self.material_count == self.max_material
+        
+        self.redraw_material()
+
+    def set_belt_speed(self, speed):
+        """Set the belt speed and the per-frame steps derived from it"""
+        self.belt_speed = speed
+        self._belt_dx = speed * self.dt  # Belt travel per frame
+        self._pulley_step = self._belt_dx / 0.6  # Pulley rotation per frame
 
     def animate(self):
         """Main animation loop"""
@@ -419,155 +547,214 @@ class ConveyorBeltSystem:
         while True:
             vp.rate(50)  # 50 fps
             
+            self._frame += 1
+            if self._frame % self.monitor_interval_frames == 0:
+                self._tick_event.set()
+            
             if not self.control_system.emergency_stop:
                 self.operating_time += self.dt
                 
                 # Update belt speed based on control system
                 target_speed = self.control_system.target_speed
-                self.belt_speed = target_speed
+                if target_speed != self.belt_speed:
+                    self.set_belt_speed(target_speed)
                 
                 # Rotate pulleys
-                rotation_speed = self.belt_speed * self.dt / 0.6
-                self.drive_pulley.rotate(angle=rotation_speed, axis=vp.vector(0, 0, 1))
-                self.idler_pulley.rotate(angle=rotation_speed, axis=vp.vector(0, 0, 1))
+                self._pending_rotation += self._pulley_step
+                if abs(self._pending_rotation) > self._min_rotation:
+                    self.drive_pulley.rotate(angle=self._pending_rotation, axis=self._pulley_axis)
+                    self.idler_pulley.rotate(angle=self._pending_rotation, axis=self._pulley_axis)
+                    self._pending_rotation = 0.0
                 
                 # Update material flow
                 self.update_material_flow()
-            
-            # Clean up invisible particles
-            self.material_particles = [p for p in self.material_particles if p.visible]
+
+@njit(cache=True, fastmath=True)
+def _model_sensors(out, belt_speed, material_count, operating_time, noise):
+    """Model every sensor from the conveyor state into out, in SENSOR_NAMES order"""
+    # Speed sensor
+    out[SPEED] = belt_speed + noise[SPEED]
+    
+    # Load sensor (percentage of max capacity)
+    max_capacity = 50.0  # Max material units on belt
+    load = min(100.0, (material_count / max_capacity) * 100)
+    out[LOAD] = load
+    
+    # Temperature sensor (increases with operation time and load)
+    ambient_temp = 25.0
+    load_factor = (load / 100) * 25
+    time_factor = min(operating_time / 3600, 1.0) * 15  # Max 15°C increase per hour
+    temperature = ambient_temp + load_factor + time_factor + noise[TEMPERATURE]
+    out[TEMPERATURE] = temperature
+    
+    # Vibration sensor (increases with speed and wear)
+    speed_vibration = (belt_speed / 3) * 10
+    wear_vibration = min(operating_time / 7200, 1.0) * 6  # Wear factor
+    out[VIBRATION] = speed_vibration + wear_vibration + noise[VIBRATION]
+    
+    # Current sensor (based on load and temperature)
+    base_current = 5.0
+    load_current = (load / 100) * 25
+    temp_current = max(0.0, (temperature - 40) * 0.5)
+    out[CURRENT] = base_current + load_current + temp_current + noise[CURRENT]
+    
+    # Belt slippage (increases with load and wear)
+    base_slippage = 0.5
+    load_slippage = (load / 100) * 5
+    wear_slippage = min(operating_time / 10000, 1.0) * 4
+    out[SLIPPAGE] = base_slippage + load_slippage + wear_slippage + noise[SLIPPAGE]
+    return out
+
+# Compile up front rather than on the monitoring thread's first tick
+_model_sensors(np.zeros(len(SENSOR_NAMES)), 0.0, 0.0, 0.0, np.zeros(len(SENSOR_NAMES)))
 
 class SensorSystem:
     """Simulates various sensors for the conveyor belt"""
     
     def __init__(self):
-        self.sensors = {
-            'speed': {'value': 0, 'unit': 'm/s', 'min': 0, 'max': 4, 'alarm_threshold': 3.2},
-            'load': {'value': 0, 'unit': '%', 'min': 0, 'max': 100, 'alarm_threshold': 85},
-            'temperature': {'value': 25, 'unit': '°C', 'min': 20, 'max': 80, 'alarm_threshold': 70},
-            'vibration': {'value': 0, 'unit': 'm/s²', 'min': 0, 'max': 20, 'alarm_threshold': 15},
-            'current': {'value': 0, 'unit': 'A', 'min': 0, 'max': 50, 'alarm_threshold': 45},
-            'slippage': {'value': 0, 'unit': '%', 'min': 0, 'max': 10, 'alarm_threshold': 8}
-        }
-        self.history = {sensor: [] for sensor in self.sensors.keys()}
-        self.alarms = []
-        
-    def update_sensors(self, belt_speed, material_count, operating_time):
-        """Update sensor values based on conveyor state"""
-        # Speed sensor
-        self.sensors['speed']['value'] = belt_speed + random.uniform(-0.05, 0.05)
-        
-        # Load sensor (percentage of max capacity)
-        max_capacity = 50  # Max material units on belt
-        self.sensors['load']['value'] = min(100, (material_count / max_capacity) * 100)
-        
-        # Temperature sensor (increases with operation time and load)
-        ambient_temp = 25
-        load_factor = (self.sensors['load']['value'] / 100) * 25
-        time_factor = min(operating_time / 3600, 1) * 15  # Max 15°C increase per hour
-        self.sensors['temperature']['value'] = ambient_temp + load_factor + time_factor + random.uniform(-1, 1)
-        
-        # Vibration sensor (increases with speed and wear)
-        speed_vibration = (belt_speed / 3) * 10
-        wear_vibration = min(operating_time / 7200, 1) * 6  # Wear factor
-        self.sensors['vibration']['value'] = speed_vibration + wear_vibration + random.uniform(-0.5, 0.5)
-        
-        # Current sensor (based on load and temperature)
-        base_current = 5
-        load_current = (self.sensors['load']['value'] / 100) * 25
-        temp_current = max(0, (self.sensors['temperature']['value'] - 40) * 0.5)
-        self.sensors['current']['value'] = base_current + load_current + temp_current + random.uniform(-1, 1)
-        
-        # Belt slippage (increases with load and wear)
-        base_slippage = 0.5
-        load_slippage = (self.sensors['load']['value'] / 100) * 5
-        wear_slippage = min(operating_time / 10000, 1) * 4
-        self.sensors['slippage']['value'] = base_slippage + load_slippage + wear_slippage + random.uniform(-0.2, 0.2)
+        # Current values and limits, indexed in SENSOR_NAMES order
+        self.values = np.array([0, 0, 25, 0, 0, 0], dtype=float)
+        self.mins = np.array(SENSOR_MINS, dtype=float)
+        self.maxs = np.array(SENSOR_MAXS, dtype=float)
+        self.thresholds = np.array(ALARM_THRESHOLDS, dtype=float)
+        self.warning_levels = self.thresholds * 0.8
+        self.noise = np.array(SENSOR_NOISE, dtype=float)
+        self.rng = np.random.default_rng()
+        self._readings = np.empty(len(SENSOR_NAMES))  # Unclamped model output
+        
+        # History ring buffer: one row of sensor values per reading, with the
+        # oldest row overwritten once max_history readings are stored
+        self.max_history = 100
+        self.history_values = np.empty((self.max_history, len(SENSOR_NAMES)))
+        self.history_ts = np.empty(self.max_history)
+        self._hist_idx = 0
+        self.alarms = deque(maxlen=500)
+        self.recent_alarms = deque(maxlen=3)  # Newest alarms, for the status report
+        
+        # Readings are stamped with time.monotonic(); this anchor converts a
+        # stamp back to wall-clock time when it is displayed
+        self._start_wallclock = time.time()
+        self._start_monotonic = time.monotonic()
+    
+    def update_sensors(self, belt_speed, material_count, operating_time, timestamp=None):
+        """Update sensor values based on conveyor state
+        
+        timestamp is the reading's time.monotonic() stamp; it defaults to now.
+        """
+        # Measurement noise for every sensor in one draw
+        noise = self.noise * self.rng.uniform(-1, 1, len(SENSOR_NAMES))
+        _model_sensors(self._readings, float(belt_speed), float(material_count),
+                       float(operating_time), noise)
         
         # Ensure values stay within realistic bounds
-        for sensor_name, sensor_data in self.sensors.items():
-            sensor_data['value'] = max(sensor_data['min'], 
-                                     min(sensor_data['max'], sensor_data['value']))
+        np.clip(self._readings, self.mins, self.maxs, out=self.values)
         
         # Store history
-        timestamp = datetime.now()
-        for sensor_name, sensor_data in self.sensors.items():
-            self.history[sensor_name].append({
-                'timestamp': timestamp,
-                'value': sensor_data['value']
-            })
-            # Keep only last 100 readings
-            if len(self.history[sensor_name]) > 100:
-                self.history[sensor_name].pop(0)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self.history_values[self._hist_idx] = self.values
+        self.history_ts[self._hist_idx] = timestamp
+        self._hist_idx = (self._hist_idx + 1) % self.max_history
         
         # Check for alarms
-        self.check_alarms()
+        self.check_alarms(timestamp)
     
-    def check_alarms(self):
+    def status_bands(self):
+        """Status band per sensor: 0 normal, 1 within 80% of threshold, 2 alarm"""
+        return (self.values > self.warning_levels).astype(np.int8) + (self.values > self.thresholds)
+    
+    def wallclock(self, timestamp):
+        """Convert a monotonic reading timestamp to a local datetime"""
+        return datetime.fromtimestamp(self._start_wallclock + (timestamp - self._start_monotonic))
+    
+    def check_alarms(self, current_time):
         """Check for alarm conditions"""
-        current_time = datetime.now()
-        for sensor_name, sensor_data in self.sensors.items():
-            if sensor_data['value'] > sensor_data['alarm_threshold']:
-                alarm = {
-                    'timestamp': current_time,
-                    'sensor': sensor_name,
-                    'value': sensor_data['value'],
-                    'unit': sensor_data['unit'],
-                    'threshold': sensor_data['alarm_threshold'],
-                    'severity': 'HIGH' if sensor_data['value'] > sensor_data['alarm_threshold'] * 1.1 else 'MEDIUM'
-                }
-                self.alarms.append(alarm)
-                print(f"🚨 ALARM: {sensor_name} = {sensor_data['value']:.2f} {sensor_data['unit']} "
-                      f"(Threshold: {sensor_data['alarm_threshold']} {sensor_data['unit']})")
+        fired = self.values > self.thresholds
+        if not fired.any():
+            return
+        
+        # Display time is formatted once per tick and shared by every alarm raised
+        clock = self.wallclock(current_time).strftime('%H:%M:%S')
+        
+        for i in np.flatnonzero(fired).tolist():
+            sensor_name, unit, threshold = SENSOR_NAMES[i], SENSOR_UNITS[i], ALARM_THRESHOLDS[i]
+            value = float(self.values[i])
+            alarm = {
+                'timestamp': current_time,
+                'clock': clock,
+                'sensor': sensor_name,
+                'value': value,
+                'unit': unit,
+                'threshold': threshold,
+                'severity': 'HIGH' if value > threshold * 1.1 else 'MEDIUM'
+            }
+            self.alarms.append(alarm)
+            self.recent_alarms.append(alarm)
+            print(ALARM_MESSAGES[i].format(value))
+
+@njit(cache=True, fastmath=True)
+def _degradation(vibration, temperature, slippage, current):
+    """Health degradation contributed by sensors running close to their limits"""
+    degradation = 0.0
+    
+    # Vibration impact
+    vib_ratio = vibration / 15.0
+    if vib_ratio > 0.7:
+        degradation += (vib_ratio - 0.7) * 15
+        
+    # Temperature impact
+    temp_ratio = temperature / 70.0
+    if temp_ratio > 0.8:
+        degradation += (temp_ratio - 0.8) * 10
+        
+    # Slippage impact
+    slip_ratio = slippage / 8.0
+    if slip_ratio > 0.8:
+        degradation += (slip_ratio - 0.8) * 12
+        
+    # Current impact (indicates motor strain)
+    curr_ratio = current / 45.0
+    if curr_ratio > 0.8:
+        degradation += (curr_ratio - 0.8) * 8
+    
+    return degradation
+
+# Compile up front rather than on the monitoring thread's first tick
+_degradation(0.0, 0.0, 0.0, 0.0)
 
 class PredictiveMaintenance:
     """Predictive maintenance system using sensor data"""
     
+    # Recommendations accumulate as health drops below each limit
+    RECOMMENDATIONS = (
+        (90, "Schedule routine inspection"),
+        (80, "Check belt tension and alignment"),
+        (70, "Lubricate bearings and inspect pulleys"),
+        (60, "⚠️ URGENT: Check for belt wear and misalignment"),
+        (50, "🔴 CRITICAL: Shutdown required for belt replacement")
+    )
+    
     def __init__(self):
         self.maintenance_score = 100  # Start at 100% health
         self.maintenance_recommendations = []
+        self._recommendation_level = 0  # Number of RECOMMENDATIONS currently listed
         
     def analyze_trends(self, sensor_system):
         """Analyze sensor trends for predictive maintenance"""
         # Calculate health degradation based on sensor values
-        degradation_factors = 0
-        
-        # Vibration impact
-        vib_ratio = sensor_system.sensors['vibration']['value'] / 15
-        if vib_ratio > 0.7:
-            degradation_factors += (vib_ratio - 0.7) * 15
-            
-        # Temperature impact
-        temp_ratio = sensor_system.sensors['temperature']['value'] / 70
-        if temp_ratio > 0.8:
-            degradation_factors += (temp_ratio - 0.8) * 10
-            
-        # Slippage impact
-        slip_ratio = sensor_system.sensors['slippage']['value'] / 8
-        if slip_ratio > 0.8:
-            degradation_factors += (slip_ratio - 0.8) * 12
-            
-        # Current impact (indicates motor strain)
-        curr_ratio = sensor_system.sensors['current']['value'] / 45
-        if curr_ratio > 0.8:
-            degradation_factors += (curr_ratio - 0.8) * 8
+        values = sensor_system.values.tolist()
+        degradation_factors = _degradation(values[VIBRATION], values[TEMPERATURE],
+                                           values[SLIPPAGE], values[CURRENT])
         
         # Update maintenance score
         self.maintenance_score = max(0, self.maintenance_score - degradation_factors * 0.01)
         
-        # Generate recommendations
-        self.maintenance_recommendations.clear()
-        
-        if self.maintenance_score < 90:
-            self.maintenance_recommendations.append("Schedule routine inspection")
-        if self.maintenance_score < 80:
-            self.maintenance_recommendations.append("Check belt tension and alignment")
-        if self.maintenance_score < 70:
-            self.maintenance_recommendations.append("Lubricate bearings and inspect pulleys")
-        if self.maintenance_score < 60:
-            self.maintenance_recommendations.append("⚠️ URGENT: Check for belt wear and misalignment")
-        if self.maintenance_score < 50:
-            self.maintenance_recommendations.append("🔴 CRITICAL: Shutdown required for belt replacement")
+        # Generate recommendations, rebuilding the list only when health
+        # crosses into a different band
+        level = sum(self.maintenance_score < limit for limit, _ in self.RECOMMENDATIONS)
+        if level != self._recommendation_level:
+            self.maintenance_recommendations[:] = [text for _, text in self.RECOMMENDATIONS[:level]]
+            self._recommendation_level = level
 
 class ControlSystem:
     """Automated control system for conveyor belt"""
@@ -577,28 +764,23 @@ class ControlSystem:
         self.target_speed = 1.5  # m/s
         self.emergency_stop = False
         
+        # Target speed for low, normal and high load, within the 0.5-3.0 m/s limits
+        self.load_speeds = tuple(np.clip([2.0, 1.5, 0.8], 0.5, 3.0).tolist())
+        
+        # Emergency stop limits, indexed in SENSOR_NAMES order
+        self.emergency_thresholds = np.array([np.inf, np.inf, 75, 18, 48, 9], dtype=float)
+        
     def update_control(self, sensor_system):
         """Update control parameters based on sensor feedback"""
         if not self.auto_mode or self.emergency_stop:
             return
         
-        # Speed control based on load
-        load_ratio = sensor_system.sensors['load']['value'] / 100
-        if load_ratio > 0.9:
-            self.target_speed = 0.8  # Reduce speed for high load
-        elif load_ratio < 0.3:
-            self.target_speed = 2.0   # Increase speed for low load
-        else:
-            self.target_speed = 1.5     # Normal speed
-            
-        # Apply limits
-        self.target_speed = max(0.5, min(3.0, self.target_speed))
+        # Speed control based on load: below 30% speeds up, above 90% slows down
+        load_ratio = float(sensor_system.values[LOAD]) / 100
+        self.target_speed = self.load_speeds[(load_ratio >= 0.3) + (load_ratio > 0.9)]
             
         # Emergency conditions
-        if (sensor_system.sensors['temperature']['value'] > 75 or
-            sensor_system.sensors['vibration']['value'] > 18 or
-            sensor_system.sensors['current']['value'] > 48 or
-            sensor_system.sensors['slippage']['value'] > 9):
+        if (sensor_system.values > self.emergency_thresholds).any():
             self.emergency_stop = True
             print("🛑 EMERGENCY STOP ACTIVATED - Critical sensor values detected!")
 
@@ -613,6 +795,7 @@ if __name__ == "__main__":
     print("  ✓ Equipment health tracking")
     print("\n🔧 Dependencies required:")
     print("  pip install vpython numpy")
+    print("  pip install numba  (optional, compiles the numeric kernels)")
     print("\nClose the VPython window to exit.")
     
     try:
@@ -0,0 +1,275 @@
+"""Sensor simulator worker, run as its own process next to the web app once
+the database has been initialized:
+
+    flask --app app init-db
+    python simulator.py
+
+Each system is simulated on its own thread while its SystemStatus row is
+marked running. The dashboard controls the worker only through the database:
+start/stop toggle SystemStatus.is_running and fault injection sets
+SystemStatus.fault_injection. Every tick publishes the serialized readings on
+SystemStatus.latest_readings and buffers history rows, which a sweeper thread
+writes to SensorData in batches.
+"""
+from concurrent.futures import ThreadPoolExecutor, wait
+from collections import deque
+from datetime import datetime
+from typing import Dict, Optional
+import signal
+import threading
+import time
+
+import numpy as np
+import orjson
+
+from app import (app, db, logger, FAULT_DEFINITIONS, SENSOR_TYPE_IDS, SYSTEM_TYPE_IDS,
+                 FaultType, SystemType, SensorData, FaultLog, MaintenanceAction,
+                 SystemStatus)
+
+# Simulated sensor baselines, in the order readings are generated each tick
+SENSOR_TYPES = ('speed', 'vibration', 'temperature', 'current', 'load', 'slippage')
+SENSOR_BASES = np.array([1.5, 5.0, 45.0, 15.0, 60.0, 2.0])
+SENSOR_VARIANCES = np.array([0.1, 1.0, 5.0, 2.0, 10.0, 0.5])
+
+# Units for the different sensors
+SENSOR_UNITS = {
+    'speed': 'm/s',
+    'vibration': 'm/s²',
+    'temperature': '°C',
+    'current': 'A',
+    'load': '%',
+    'slippage': '%'
+}
+
+# Multiplier range applied to a sensor's reading while a fault is injected
+FAULT_MULTIPLIER_RANGES = {
+    (FaultType.BALL_BEARING, 'vibration'): (2.0, 4.0),  # Significant vibration increase
+    (FaultType.BELT_SLIPPAGE, 'speed'): (0.6, 0.8),  # Speed reduction
+    (FaultType.DRIVE_MOTOR, 'current'): (1.5, 2.5),  # Current increase
+    (FaultType.CENTRAL_SHAFT, 'vibration'): (1.8, 3.0),  # Vibration increase
+    (FaultType.IDLER_ROLLER, 'temperature'): (1.3, 1.8),  # Temperature increase
+    (FaultType.PULLEY, 'speed'): (1.2, 2.0),  # Multiple symptoms
+    (FaultType.PULLEY, 'vibration'): (1.2, 2.0)
+}
+
+# FAULT_MULTIPLIER_RANGES laid out per fault over SENSOR_TYPES as (low, high,
+# anomaly flags), so a tick resolves its fault with one lookup
+NO_ANOMALIES = np.zeros(len(SENSOR_TYPES), dtype=bool)
+FAULT_PROFILES = {}
+for fault_type in FaultType:
+    ranges = [FAULT_MULTIPLIER_RANGES.get((fault_type, sensor_type)) for sensor_type in SENSOR_TYPES]
+    FAULT_PROFILES[fault_type] = (
+        np.array([r[0] if r else 1.0 for r in ranges]),
+        np.array([r[1] if r else 1.0 for r in ranges]),
+        np.array([r is not None for r in ranges])
+    )
+
+TICK_INTERVAL = 2  # seconds between readings while a system is running
+IDLE_POLL_INTERVAL = 1  # seconds between checks while a system is stopped
+
+# Sensor history is buffered in memory and written to SQLite in batches by
+# a single sweeper thread, keeping disk I/O out of the simulator loop
+SENSOR_FLUSH_INTERVAL = 10  # seconds
+pending_rows = deque(maxlen=50000)
+
+stop_event = threading.Event()
+
+def simulate_sensor_readings(rng: np.random.Generator, timestamp: datetime,
+                             fault_injection: Optional[FaultType] = None) -> Dict[str, Dict]:
+    """Simulate one reading for every sensor with optional fault injection
+    
+    Readings are plain dicts in the shape served by /api/sensor-data, so the
+    result can be published without any conversion.
+    """
+    
+    # Normal readings for all sensors in one draw
+    values = SENSOR_BASES + rng.uniform(-SENSOR_VARIANCES, SENSOR_VARIANCES)
+    anomalies = NO_ANOMALIES
+    
+    # Inject faults to test system behavior
+    if fault_injection:
+        low, high, anomalies = FAULT_PROFILES[fault_injection]
+        values *= rng.uniform(low, high)
+    
+    return {
+        sensor_type: {
+            'value': value,
+            'unit': get_sensor_unit(sensor_type),
+            'timestamp': timestamp,
+            'is_anomaly': is_anomaly
+        }
+        for sensor_type, value, is_anomaly in zip(SENSOR_TYPES, values.tolist(), anomalies.tolist())
+    }
+
+def get_sensor_unit(sensor_type: str) -> str:
+    """Get unit for sensor type"""
+    return SENSOR_UNITS.get(sensor_type, '')
+
+def store_sensor_readings(system_type: SystemType, readings: Dict[str, Dict]):
+    """Queue a tick's sensor readings for the next batched database flush"""
+    system_type_id = SYSTEM_TYPE_IDS[system_type]
+    pending_rows.extend({
+        'timestamp': reading['timestamp'],
+        'system_type': system_type_id,
+        'sensor_type': SENSOR_TYPE_IDS[sensor_type],
+        'value': reading['value'],
+        'is_anomaly': reading['is_anomaly']
+    } for sensor_type, reading in readings.items())
+
+def flush_sensor_readings():
+    """Write all buffered sensor readings in a single transaction"""
+    rows = []
+    while pending_rows:
+        rows.append(pending_rows.popleft())
+    
+    if rows:
+        try:
+            db.session.execute(SensorData.__table__.insert(), rows)
+            db.session.commit()
+        except Exception:
+            # Put the batch back in order so the next sweep retries it
+            pending_rows.extendleft(reversed(rows))
+            raise
+    return len(rows)
+
+def sweep_sensor_readings():
+    """Periodically flush buffered sensor readings to the database"""
+    with app.app_context():
+        while not stop_event.wait(SENSOR_FLUSH_INTERVAL):
+            try:
+                flush_sensor_readings()
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error flushing sensor readings: {e}")
+
+def simulate_system_data(system_type: SystemType):
+    """Simulate continuous sensor data for a system while it is marked running"""
+    logger.info(f"Starting simulator for {system_type.value}")
+    
+    # Each simulator thread owns its generator, so systems never contend on shared RNG state
+    rng = np.random.default_rng()
+    
+    # Ticks are scheduled against the monotonic clock so the sample period
+    # does not stretch by however long the database work took
+    next_tick = time.monotonic()
+    
+    with app.app_context():
+        while not stop_event.is_set():
+            try:
+                system_status = SystemStatus.query.filter_by(system_type=system_type).first()
+                if not system_status or not system_status.is_running:
+                    # End the read so the next poll sees the dashboard's changes
+                    db.session.commit()
+                    stop_event.wait(IDLE_POLL_INTERVAL)
+                    next_tick = time.monotonic()
+                    continue
+                
+                fault_injection = system_status.fault_injection
+                now = datetime.utcnow()
+                
+                # Generate readings for all sensors, sharing one sample timestamp
+                current_readings = simulate_sensor_readings(rng, now, fault_injection)
+                store_sensor_readings(system_type, current_readings)
+                
+                # Publish the serialized snapshot for the web process
+                system_status.latest_readings = orjson.dumps(current_readings).decode()
+                system_status.updated_at = now
+                db.session.commit()
+                
+                # Check for fault conditions and create predictions
+                if fault_injection:
+                    create_fault_prediction(system_type, fault_injection, current_readings, now)
+                
+                next_tick += TICK_INTERVAL
+                delay = next_tick - time.monotonic()
+                if delay > 0:
+                    stop_event.wait(delay)
+                else:
+                    # Resync rather than bursting through the missed ticks
+                    logger.warning("Simulator for %s behind by %.3fs", system_type.value, -delay)
+                    next_tick = time.monotonic()
+                
+            except Exception as e:
+                db.session.rollback()
+                logger.error(f"Error in simulation for {system_type.value}: {e}")
+                stop_event.wait(5)
+                next_tick = time.monotonic()
+
+def create_fault_prediction(system_type: SystemType, fault_type: FaultType, readings: Dict,
+                            timestamp: datetime):
+    """Create fault prediction based on sensor readings"""
+    
+    # Calculate confidence based on anomaly detection
+    anomaly_count = sum(1 for reading in readings.values() if reading['is_anomaly'])
+    confidence = min(0.95, 0.6 + (anomaly_count / len(readings)) * 0.35)
+    
+    # Determine severity
+    if confidence > 0.9:
+        severity = "CRITICAL"
+    elif confidence > 0.7:
+        severity = "HIGH"
+    elif confidence > 0.5:
+        severity = "MEDIUM"
+    else:
+        severity = "LOW"
+    
+    # Get fault information
+    fault_info = FAULT_DEFINITIONS[fault_type]
+    
+    # Create fault log entry
+    fault_log = FaultLog(
+        timestamp=timestamp,
+        system_type=system_type,
+        fault_type=fault_type,
+        confidence=confidence,
+        severity=severity
+    )
+    
+    db.session.add(fault_log)
+    db.session.commit()
+    
+    # Create maintenance actions
+    db.session.bulk_insert_mappings(MaintenanceAction, [{
+        'fault_log_id': fault_log.id,
+        'action_description': action,
+        'priority': severity,
+        'estimated_duration': 30 + i * 15,  # Estimated duration
+        'required_tools': fault_info['tools_required_str'],
+        'safety_precautions': fault_info['safety_precautions_str']
+    } for i, action in enumerate(fault_info['maintenance_steps'])])
+    
+    db.session.commit()
+    
+    logger.info(f"Created fault prediction: {fault_type.name} for {system_type.value} with confidence {confidence:.2f}")
+
+def handle_sigterm(signum, frame):
+    """Stop the simulator threads so main() flushes the buffer before exiting"""
+    logger.info("Stopping simulator")
+    stop_event.set()
+
+def main():
+    """Run one simulator thread per system until interrupted"""
+    # Service managers stop the worker with SIGTERM, which would otherwise
+    # exit without flushing buffered readings
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    
+    sweeper = threading.Thread(target=sweep_sensor_readings)
+    sweeper.daemon = True
+    sweeper.start()
+    
+    executor = ThreadPoolExecutor(max_workers=len(SystemType), thread_name_prefix='simulator')
+    futures = [executor.submit(simulate_system_data, system) for system in SystemType]
+    try:
+        wait(futures)
+    except KeyboardInterrupt:
+        logger.info("Stopping simulator")
+    finally:
+        stop_event.set()
+        executor.shutdown(wait=True)
+        
+        # Persist whatever is still buffered
+        with app.app_context():
+            flush_sensor_readings()
+
+if __name__ == '__main__':
+    main()
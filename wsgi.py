@@ -0,0 +1,19 @@
+"""WSGI entry point for running the dashboard under a production server.
+
+    flask --app app init-db
+    gunicorn -w 4 -k gthread --threads 32 wsgi:app
+    python simulator.py
+
+Initialize the database once before starting any workers; the web workers and
+the simulator only open it. The web workers hold no simulation state, so they
+can be scaled freely; sensor data comes from the single simulator process
+through the database.
+
+Each open /api/sensor-stream connection holds one worker thread for as long as
+the dashboard stays open, so size --threads above the expected number of open
+dashboards per worker plus headroom for API requests. Streams do not query the
+database themselves; one poller thread per worker reads the latest readings
+and wakes them. Avoid gevent workers: sqlite3 calls block the whole worker, so
+a request waiting out the simulator's write lock would stall every open stream.
+"""
+from app import app